@@ -154,4 +154,4 @@ const server = Bun.serve({
 
 console.log(`🚀 Charts Agent Container listening on port ${server.port}`);
 console.log(`📊 Technical Analysis Service ready`);
-console.log(`🔬 Python ML Stack: TA-Lib, pandas, numpy, scikit-learn`);
+console.log(`🔬 Python ML Stack: numpy, Numba, scikit-learn`);
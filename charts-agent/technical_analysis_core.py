@@ -0,0 +1,1225 @@
+"""
+Technical Analysis Engine for Charts Agent
+Provides advanced TA indicators, pattern recognition, and AI-powered analysis
+"""
+
+import copy
+import os
+import threading
+from collections import deque
+from math import isnan, nan, sqrt
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, fields, replace
+from operator import itemgetter
+import numpy as np
+from cachetools import TTLCache
+from numba import njit, prange
+
+@dataclass
+class OHLCVData:
+    """OHLCV candlestick data"""
+    timestamp: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+# OHLCV row keys in OHLCVBuffer row order
+_OHLCV_KEYS = ('open', 'high', 'low', 'close', 'volume')
+
+class OHLCVBuffer:
+    """
+    Struct-of-arrays OHLCV series
+
+    Price and volume columns live in one C-contiguous (5, N) block, so each
+    property is a contiguous view the compiled kernels read without copying.
+    The block is float64 by default; float32 halves its memory footprint and
+    the kernels still accumulate in float64. Millisecond timestamps are kept
+    in a separate int64 array since float32 cannot represent them.
+    """
+
+    def __init__(self, data: np.ndarray, ts: np.ndarray):
+        self.data = data
+        self.ts = ts
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict], dtype=np.float64) -> 'OHLCVBuffer':
+        """Build a timestamp-sorted buffer from OHLCV dictionaries"""
+        if not rows:
+            raise ValueError('No OHLCV data provided')
+
+        n = len(rows)
+        ts = np.fromiter((row['timestamp'] for row in rows), dtype=np.int64, count=n)
+        data = np.empty((len(_OHLCV_KEYS), n), dtype=dtype)
+        for i, key in enumerate(_OHLCV_KEYS):
+            data[i] = np.fromiter((row[key] for row in rows), dtype=np.float64, count=n)
+
+        if n > 1 and (ts[1:] < ts[:-1]).any():
+            order = np.argsort(ts, kind='stable')
+            data = np.take(data, order, axis=1)
+            ts = ts[order]
+
+        return cls(data, ts)
+
+    def __len__(self) -> int:
+        return self.data.shape[1]
+
+    @property
+    def open(self) -> np.ndarray:
+        return self.data[0]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.data[1]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.data[2]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.data[3]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.data[4]
+
+@dataclass
+class TechnicalIndicators:
+    """Collection of technical indicators"""
+    # Trend Indicators
+    sma_20: Optional[float] = None
+    sma_50: Optional[float] = None
+    sma_200: Optional[float] = None
+    ema_12: Optional[float] = None
+    ema_26: Optional[float] = None
+
+    # Momentum Indicators
+    rsi_14: Optional[float] = None
+    macd: Optional[float] = None
+    macd_signal: Optional[float] = None
+    macd_histogram: Optional[float] = None
+    stoch_k: Optional[float] = None
+    stoch_d: Optional[float] = None
+
+    # Volatility Indicators
+    bb_upper: Optional[float] = None
+    bb_middle: Optional[float] = None
+    bb_lower: Optional[float] = None
+    atr_14: Optional[float] = None
+
+    # Volume Indicators
+    obv: Optional[float] = None
+    vwap: Optional[float] = None
+
+_IND_FIELDS = tuple(f.name for f in fields(TechnicalIndicators))
+
+@dataclass
+class PatternRecognition:
+    """Candlestick pattern recognition results"""
+    patterns_found: List[str]
+    bullish_patterns: List[str]
+    bearish_patterns: List[str]
+    strength: str  # 'weak', 'moderate', 'strong'
+
+@dataclass
+class TrendAnalysis:
+    """Trend analysis results"""
+    trend_direction: str  # 'bullish', 'bearish', 'neutral', 'sideways'
+    trend_strength: float  # 0-100
+    support_levels: List[float]
+    resistance_levels: List[float]
+    pivot_points: Dict[str, float]
+
+@dataclass
+class TechnicalAnalysisResult:
+    """Complete technical analysis result"""
+    symbol: str
+    timestamp: int
+    current_price: float
+    indicators: TechnicalIndicators
+    patterns: PatternRecognition
+    trend: TrendAnalysis
+    signals: Dict[str, str]  # buy/sell/hold signals
+    confidence: float  # 0-100
+
+# Candlestick patterns evaluated by last_bar_patterns; bit i of each mask is _PATTERN_NAMES[i]
+_PATTERN_NAMES = (
+    'HAMMER',
+    'INVERTED_HAMMER',
+    'MORNING_STAR',
+    'BULLISH_ENGULFING',
+    'PIERCING',
+    'THREE_WHITE_SOLDIERS',
+    'DOJI',
+    'DRAGONFLY_DOJI',
+    'HANGING_MAN',
+    'SHOOTING_STAR',
+    'EVENING_STAR',
+    'BEARISH_ENGULFING',
+    'DARK_CLOUD_COVER',
+    'THREE_BLACK_CROWS',
+)
+
+# Bars read by last_bar_patterns: three-candle patterns plus one bar of prior trend context
+PATTERN_BARS = 4
+
+@njit(['UniTuple(int64, 3)(float64[::1], float64[::1], float64[::1], float64[::1])',
+       'UniTuple(int64, 3)(float32[::1], float32[::1], float32[::1], float32[::1])'], cache=True)
+def last_bar_patterns(o, h, l, c):
+    """
+    Detect candlestick patterns completed by the last bar in a single pass
+
+    Only the last PATTERN_BARS bars are read. Body and shadow sizes are
+    measured relative to each candle's own high-low range.
+
+    These are this module's own pattern definitions, not TA-Lib-equivalent
+    ones: TA-Lib's CDL* functions compare against 10-bar average body and
+    shadow sizes, so hit sets differ substantially for most patterns (only
+    engulfing agrees bar for bar).
+
+    Returns:
+        (found_mask, bullish_mask, bearish_mask) bitmasks indexed by _PATTERN_NAMES
+    """
+    found = 0
+    bullish = 0
+    bearish = 0
+    n = c.shape[0]
+    if n == 0:
+        return found, bullish, bearish
+
+    i = n - 1
+    body = abs(c[i] - o[i])
+    candle_range = h[i] - l[i]
+    upper_shadow = h[i] - max(o[i], c[i])
+    lower_shadow = min(o[i], c[i]) - l[i]
+
+    prior_up = False
+    prior_down = False
+    if n >= 4:
+        prior_up = c[i - 1] > c[i - 3]
+        prior_down = c[i - 1] < c[i - 3]
+
+    if candle_range > 0:
+        # Doji family: open and close (almost) equal
+        if body <= 0.1 * candle_range:
+            found |= 1 << 6
+            if upper_shadow <= 0.1 * candle_range and lower_shadow >= 0.6 * candle_range:
+                found |= 1 << 7
+                bullish |= 1 << 7
+
+        # Small body near the top with a long lower shadow
+        elif lower_shadow >= 2.0 * body and upper_shadow <= 0.1 * candle_range:
+            if prior_down:
+                found |= 1 << 0
+                bullish |= 1 << 0
+            elif prior_up:
+                found |= 1 << 8
+                bearish |= 1 << 8
+
+        # Small body near the bottom with a long upper shadow
+        elif upper_shadow >= 2.0 * body and lower_shadow <= 0.1 * candle_range:
+            if prior_down:
+                found |= 1 << 1
+                bullish |= 1 << 1
+            elif prior_up:
+                found |= 1 << 9
+                bearish |= 1 << 9
+
+    if n >= 2:
+        j = i - 1
+        prev_body = abs(c[j] - o[j])
+        prev_range = h[j] - l[j]
+        prev_mid = (o[j] + c[j]) / 2.0
+        prev_long = prev_range > 0 and prev_body >= 0.5 * prev_range
+
+        # Engulfing: the current body swallows an opposite-colored previous body
+        if c[j] < o[j] and c[i] > o[i] and o[i] <= c[j] and c[i] >= o[j] and body > prev_body:
+            found |= 1 << 3
+            bullish |= 1 << 3
+        elif c[j] > o[j] and c[i] < o[i] and o[i] >= c[j] and c[i] <= o[j] and body > prev_body:
+            found |= 1 << 11
+            bearish |= 1 << 11
+
+        # Piercing / dark cloud cover: gap past the previous extreme, close beyond its midpoint
+        if prev_long and c[j] < o[j] and c[i] > o[i] and o[i] < l[j] and prev_mid < c[i] < o[j]:
+            found |= 1 << 4
+            bullish |= 1 << 4
+        elif prev_long and c[j] > o[j] and c[i] < o[i] and o[i] > h[j] and o[j] < c[i] < prev_mid:
+            found |= 1 << 12
+            bearish |= 1 << 12
+
+    if n >= 3:
+        a = i - 2
+        b = i - 1
+        first_body = abs(c[a] - o[a])
+        first_range = h[a] - l[a]
+        first_mid = (o[a] + c[a]) / 2.0
+        first_long = first_range > 0 and first_body >= 0.5 * first_range
+        star_body = abs(c[b] - o[b])
+        star_small = star_body <= 0.3 * first_body
+
+        # Morning / evening star: long candle, small gapped star, strong reversal candle
+        if first_long and star_small and c[a] < o[a] and max(o[b], c[b]) < c[a] and c[i] > o[i] and c[i] > first_mid:
+            found |= 1 << 2
+            bullish |= 1 << 2
+        elif first_long and star_small and c[a] > o[a] and min(o[b], c[b]) > c[a] and c[i] < o[i] and c[i] < first_mid:
+            found |= 1 << 10
+            bearish |= 1 << 10
+
+        # Three white soldiers / black crows: three long same-colored candles stepping in one direction
+        soldiers = True
+        crows = True
+        for k in range(a, i + 1):
+            k_body = abs(c[k] - o[k])
+            k_range = h[k] - l[k]
+            if k_range <= 0 or k_body < 0.5 * k_range:
+                soldiers = False
+                crows = False
+                break
+            if not (c[k] > o[k] and h[k] - c[k] <= 0.25 * k_range):
+                soldiers = False
+            if not (c[k] < o[k] and c[k] - l[k] <= 0.25 * k_range):
+                crows = False
+            if k > a:
+                if not (c[k] > c[k - 1] and o[k - 1] < o[k] < c[k - 1]):
+                    soldiers = False
+                if not (c[k] < c[k - 1] and c[k - 1] < o[k] < o[k - 1]):
+                    crows = False
+        if soldiers:
+            found |= 1 << 5
+            bullish |= 1 << 5
+        elif crows:
+            found |= 1 << 13
+            bearish |= 1 << 13
+
+    return found, bullish, bearish
+
+@njit(['float64(float64[::1], float64[::1])',
+       'float64(float32[::1], float32[::1])'], cache=True, fastmath=True)
+def vwap_last(close, volume):
+    """Volume weighted average price over the whole series, in one pass"""
+    num = 0.0
+    den = 0.0
+    for i in range(close.shape[0]):
+        num += close[i] * volume[i]
+        den += volume[i]
+    return num / den if den > 0 else np.nan
+
+# Support/resistance: bars scanned for local extrema and bars on each side an extremum must dominate
+SR_LOOKBACK = 100
+SR_ORDER = 5
+
+@njit(['Tuple((int64[::1], int64[::1]))(float64[::1], float64[::1], int64)',
+       'Tuple((int64[::1], int64[::1]))(float32[::1], float32[::1], int64)'], cache=True)
+def rolling_extrema(high, low, k):
+    """
+    Indices of local highs/lows: bars whose high (low) is the max (min) of the k bars on either side
+
+    Uses monotonic index queues for the sliding 2k+1 window, so the whole
+    scan is O(N). The last k bars are not confirmed yet and never qualify.
+    """
+    n = high.shape[0]
+    width = 2 * k + 1
+    maxima = np.empty(n, dtype=np.int64)
+    minima = np.empty(n, dtype=np.int64)
+    max_queue = np.empty(n, dtype=np.int64)
+    min_queue = np.empty(n, dtype=np.int64)
+    n_max = 0
+    n_min = 0
+    max_head = 0
+    max_tail = 0
+    min_head = 0
+    min_tail = 0
+
+    for j in range(n):
+        while max_tail > max_head and high[max_queue[max_tail - 1]] <= high[j]:
+            max_tail -= 1
+        max_queue[max_tail] = j
+        max_tail += 1
+        if max_queue[max_head] <= j - width:
+            max_head += 1
+
+        while min_tail > min_head and low[min_queue[min_tail - 1]] >= low[j]:
+            min_tail -= 1
+        min_queue[min_tail] = j
+        min_tail += 1
+        if min_queue[min_head] <= j - width:
+            min_head += 1
+
+        # The window [j - 2k, j] is complete; test its center bar
+        i = j - k
+        if i >= k:
+            if high[i] == high[max_queue[max_head]]:
+                maxima[n_max] = i
+                n_max += 1
+            if low[i] == low[min_queue[min_head]]:
+                minima[n_min] = i
+                n_min += 1
+
+    return maxima[:n_max], minima[:n_min]
+
+@njit(['float64(float64[::1], int64)',
+       'float64(float32[::1], int64)'], cache=True)
+def _sma_last(x, period):
+    n = x.shape[0]
+    if n < period:
+        return np.nan
+    total = 0.0
+    for i in range(n - period, n):
+        total += x[i]
+    return total / period
+
+@njit(['float64(float64[::1], int64)',
+       'float64(float32[::1], int64)'], cache=True)
+def _ema_last(x, period):
+    n = x.shape[0]
+    if n < period:
+        return np.nan
+    alpha = 2.0 / (period + 1)
+    ema = 0.0
+    for i in range(period):
+        ema += x[i]
+    ema /= period
+    for i in range(period, n):
+        ema += alpha * (x[i] - ema)
+    return ema
+
+@njit(['float64(float64[::1], int64)',
+       'float64(float32[::1], int64)'], cache=True)
+def _rsi_last(x, period):
+    n = x.shape[0]
+    if n <= period:
+        return np.nan
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        change = x[i] - x[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        if i <= period:
+            avg_gain += gain / period
+            avg_loss += loss / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+    total = avg_gain + avg_loss
+    return 100.0 * avg_gain / total if total != 0 else 0.0
+
+@njit(['UniTuple(float64, 3)(float64[::1], int64, int64, int64)',
+       'UniTuple(float64, 3)(float32[::1], int64, int64, int64)'], cache=True)
+def _macd_last(x, fast_period, slow_period, signal_period):
+    n = x.shape[0]
+    if n < slow_period + signal_period - 1:
+        return np.nan, np.nan, np.nan
+
+    # Both EMAs are seeded on bar slow_period - 1, as TA-Lib does
+    fast_alpha = 2.0 / (fast_period + 1)
+    slow_alpha = 2.0 / (slow_period + 1)
+    signal_alpha = 2.0 / (signal_period + 1)
+    fast = 0.0
+    slow = 0.0
+    for i in range(slow_period):
+        slow += x[i]
+        if i >= slow_period - fast_period:
+            fast += x[i]
+    fast /= fast_period
+    slow /= slow_period
+
+    macd = fast - slow
+    signal = macd
+    for i in range(slow_period, n):
+        fast += fast_alpha * (x[i] - fast)
+        slow += slow_alpha * (x[i] - slow)
+        macd = fast - slow
+        if i < slow_period + signal_period - 1:
+            signal += macd
+            if i == slow_period + signal_period - 2:
+                signal /= signal_period
+        else:
+            signal += signal_alpha * (macd - signal)
+    return macd, signal, macd - signal
+
+@njit(['float64(float64[::1], float64[::1], float64[::1], int64, int64)',
+       'float64(float32[::1], float32[::1], float32[::1], int64, int64)'], cache=True)
+def _fastk_at(high, low, close, i, period):
+    highest = high[i]
+    lowest = low[i]
+    for k in range(i - period + 1, i):
+        highest = max(highest, high[k])
+        lowest = min(lowest, low[k])
+    price_range = highest - lowest
+    return 100.0 * (close[i] - lowest) / price_range if price_range > 0 else 0.0
+
+@njit(['UniTuple(float64, 2)(float64[::1], float64[::1], float64[::1], int64, int64, int64)',
+       'UniTuple(float64, 2)(float32[::1], float32[::1], float32[::1], int64, int64, int64)'], cache=True)
+def _stoch_last(high, low, close, fastk_period, slowk_period, slowd_period):
+    n = close.shape[0]
+    smoothing = slowk_period + slowd_period - 1
+    if n < fastk_period + smoothing - 1:
+        return np.nan, np.nan
+    fastk = np.empty(smoothing)
+    for j in range(smoothing):
+        fastk[j] = _fastk_at(high, low, close, n - smoothing + j, fastk_period)
+    slowk = 0.0
+    slowd = 0.0
+    for j in range(slowd_period):
+        k_value = 0.0
+        for m in range(j, j + slowk_period):
+            k_value += fastk[m]
+        slowk = k_value / slowk_period
+        slowd += slowk
+    return slowk, slowd / slowd_period
+
+@njit(['UniTuple(float64, 3)(float64[::1], int64, float64)',
+       'UniTuple(float64, 3)(float32[::1], int64, float64)'], cache=True)
+def _bbands_last(x, period, num_std):
+    middle = _sma_last(x, period)
+    if np.isnan(middle):
+        return np.nan, np.nan, np.nan
+    n = x.shape[0]
+    variance = 0.0
+    for i in range(n - period, n):
+        variance += (x[i] - middle) ** 2
+    deviation = num_std * np.sqrt(variance / period)
+    return middle + deviation, middle, middle - deviation
+
+@njit(['float64(float64[::1], float64[::1], float64[::1], int64)',
+       'float64(float32[::1], float32[::1], float32[::1], int64)'], cache=True)
+def _atr_last(high, low, close, period):
+    n = close.shape[0]
+    if n <= period:
+        return np.nan
+    atr = 0.0
+    for i in range(1, n):
+        true_range = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        if i <= period:
+            atr += true_range / period
+        else:
+            atr = (atr * (period - 1) + true_range) / period
+    return atr
+
+@njit(['float64(float64[::1], float64[::1])',
+       'float64(float32[::1], float32[::1])'], cache=True)
+def _obv_last(close, volume):
+    obv = np.float64(volume[0])
+    for i in range(1, close.shape[0]):
+        if close[i] > close[i - 1]:
+            obv += volume[i]
+        elif close[i] < close[i - 1]:
+            obv -= volume[i]
+    return obv
+
+@njit(['void(float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], int64[::1])',
+       'void(float32[::1], float32[::1], float32[::1], float32[::1], float32[::1], float64[::1], int64[::1])'],
+      cache=True)
+def last_bar_engine(o, h, l, c, v, indicators, patterns):
+    """
+    Whole latest-bar analysis pipeline for one symbol in a single compiled call
+
+    Args:
+        o, h, l, c, v: contiguous OHLCVBuffer rows, float64 or float32, N >= 1
+        indicators: (17,) float64 output, filled in TechnicalIndicators field
+            order with NaN where history is too short
+        patterns: (3,) int64 output, found/bullish/bearish masks from last_bar_patterns
+    """
+
+    # Trend Indicators
+    indicators[0] = _sma_last(c, 20)
+    indicators[1] = _sma_last(c, 50)
+    indicators[2] = _sma_last(c, 200)
+    indicators[3] = _ema_last(c, 12)
+    indicators[4] = _ema_last(c, 26)
+
+    # Momentum Indicators
+    indicators[5] = _rsi_last(c, 14)
+    indicators[6], indicators[7], indicators[8] = _macd_last(c, 12, 26, 9)
+    indicators[9], indicators[10] = _stoch_last(h, l, c, 14, 3, 3)
+
+    # Volatility Indicators
+    indicators[11], indicators[12], indicators[13] = _bbands_last(c, 20, 2.0)
+    indicators[14] = _atr_last(h, l, c, 14)
+
+    # Volume Indicators
+    indicators[15] = _obv_last(c, v)
+    indicators[16] = vwap_last(c, v)
+
+    tail = max(0, c.shape[0] - PATTERN_BARS)
+    patterns[0], patterns[1], patterns[2] = last_bar_patterns(o[tail:], h[tail:], l[tail:], c[tail:])
+
+@njit(['Tuple((float64[:, ::1], int64[:, ::1]))(float64[:, ::1], int64[::1])',
+       'Tuple((float64[:, ::1], int64[:, ::1]))(float32[:, ::1], int64[::1])'], cache=True, parallel=True)
+def batch_last_indicators(data, offsets):
+    """
+    Run last_bar_engine for many symbols at once
+
+    Args:
+        data: (5, total_bars) OHLCVBuffer rows of all symbols concatenated along axis 1
+        offsets: symbol s owns columns offsets[s]:offsets[s + 1]; every symbol needs at least one bar
+
+    Returns:
+        (indicators, patterns): (n_symbols, 17) float64 and (n_symbols, 3) int64
+        arrays laid out as in last_bar_engine
+    """
+    n_symbols = offsets.shape[0] - 1
+    indicators = np.empty((n_symbols, 17))
+    patterns = np.empty((n_symbols, 3), dtype=np.int64)
+
+    for s in prange(n_symbols):
+        start = offsets[s]
+        end = offsets[s + 1]
+        # Row slices of a C-contiguous block stay contiguous, unlike a 2-D column slice
+        last_bar_engine(data[0, start:end], data[1, start:end], data[2, start:end], data[3, start:end],
+                        data[4, start:end], indicators[s], patterns[s])
+
+    return indicators, patterns
+
+# patterns_found reports engulfing once, undirected; the direction goes to the bullish/bearish lists
+_FOUND_PATTERN_NAMES = tuple('ENGULFING' if name.endswith('_ENGULFING') else name for name in _PATTERN_NAMES)
+
+def _decode_patterns(mask: int, names: Tuple[str, ...] = _PATTERN_NAMES) -> List[str]:
+    """Expand a last_bar_patterns bitmask into pattern names"""
+    return [name for bit, name in enumerate(names) if mask >> bit & 1]
+
+def _optional_float(value) -> Optional[float]:
+    """Convert an indicator value to float, mapping NaN (insufficient data) to None"""
+    value = float(value)
+    return None if value != value else value  # NaN is the only value unequal to itself
+
+class SMAState:
+    """Running simple moving average over a fixed window"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.total = 0.0
+
+    def update(self, price: float) -> float:
+        if len(self.values) == self.window:
+            self.total -= self.values[0]
+        self.values.append(price)
+        self.total += price
+        if len(self.values) < self.window:
+            return nan
+        return self.total / self.window
+
+class EMAState:
+    """Exponential moving average seeded with the SMA of the first `period` values (TA-Lib default)"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.prev = nan
+        self.count = 0
+        self.seed_total = 0.0
+
+    def update(self, price: float) -> float:
+        self.count += 1
+        if self.count < self.period:
+            self.seed_total += price
+            return nan
+        if self.count == self.period:
+            self.prev = (self.seed_total + price) / self.period
+        else:
+            self.prev += self.alpha * (price - self.prev)
+        return self.prev
+
+class RSIState:
+    """Relative Strength Index using Wilder's smoothing of average gain/loss"""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.prev_price = nan
+        self.count = 0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+
+    def update(self, price: float) -> float:
+        if self.count == 0:
+            self.prev_price = price
+            self.count = 1
+            return nan
+
+        change = price - self.prev_price
+        self.prev_price = price
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+
+        if self.count <= self.period:
+            # Seed averages with the simple mean of the first `period` changes
+            self.avg_gain += gain / self.period
+            self.avg_loss += loss / self.period
+            self.count += 1
+            if self.count <= self.period:
+                return nan
+        else:
+            self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+            self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+
+        total = self.avg_gain + self.avg_loss
+        return 100.0 * self.avg_gain / total if total != 0 else 0.0
+
+class MACDState:
+    """MACD line, signal and histogram built from fast/slow/signal EMAStates"""
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        self.fast = EMAState(fast_period)
+        self.slow = EMAState(slow_period)
+        self.signal = EMAState(signal_period)
+        # The fast EMA starts late so both EMAs are seeded on the same bar, as TA-Lib does
+        self.fast_delay = slow_period - fast_period
+        self.count = 0
+
+    def update(self, price: float) -> Tuple[float, float, float]:
+        self.count += 1
+        slow = self.slow.update(price)
+        fast = self.fast.update(price) if self.count > self.fast_delay else nan
+        if isnan(slow):
+            return nan, nan, nan
+
+        macd = fast - slow
+        signal = self.signal.update(macd)
+        if isnan(signal):
+            return nan, nan, nan
+        return macd, signal, macd - signal
+
+class BBState:
+    """Bollinger Bands with Welford running variance over a sliding window"""
+
+    def __init__(self, window: int = 20, num_std: float = 2.0):
+        self.window = window
+        self.num_std = num_std
+        self.values = deque(maxlen=window)
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, price: float) -> Tuple[float, float, float]:
+        if len(self.values) < self.window:
+            self.values.append(price)
+            delta = price - self.mean
+            self.mean += delta / len(self.values)
+            self.m2 += delta * (price - self.mean)
+            if len(self.values) < self.window:
+                return nan, nan, nan
+        else:
+            oldest = self.values[0]
+            self.values.append(price)
+            prev_mean = self.mean
+            self.mean += (price - oldest) / self.window
+            self.m2 += (price - oldest) * (price - self.mean + oldest - prev_mean)
+
+        # Population standard deviation, matching TA-Lib BBANDS
+        deviation = self.num_std * sqrt(max(self.m2, 0.0) / self.window)
+        return self.mean + deviation, self.mean, self.mean - deviation
+
+class StochState:
+    """Slow stochastic oscillator (%K smoothed, %D of smoothed %K)"""
+
+    def __init__(self, fastk_period: int = 14, slowk_period: int = 3, slowd_period: int = 3):
+        self.highs = deque(maxlen=fastk_period)
+        self.lows = deque(maxlen=fastk_period)
+        self.slowk = SMAState(slowk_period)
+        self.slowd = SMAState(slowd_period)
+
+    def update(self, high: float, low: float, close: float) -> Tuple[float, float]:
+        self.highs.append(high)
+        self.lows.append(low)
+        if len(self.highs) < self.highs.maxlen:
+            return nan, nan
+
+        highest = max(self.highs)
+        lowest = min(self.lows)
+        price_range = highest - lowest
+        fastk = 100.0 * (close - lowest) / price_range if price_range > 0 else 0.0
+
+        slowk = self.slowk.update(fastk)
+        if isnan(slowk):
+            return nan, nan
+        slowd = self.slowd.update(slowk)
+        if isnan(slowd):
+            return nan, nan
+        return slowk, slowd
+
+class ATRState:
+    """Average True Range with Wilder's smoothing"""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.prev_close = nan
+        self.count = 0
+        self.atr = 0.0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        if self.count == 0:
+            self.prev_close = close
+            self.count = 1
+            return nan
+
+        true_range = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+
+        if self.count <= self.period:
+            self.atr += true_range / self.period
+            self.count += 1
+            if self.count <= self.period:
+                return nan
+        else:
+            self.atr = (self.atr * (self.period - 1) + true_range) / self.period
+        return self.atr
+
+class OBVState:
+    """On-Balance Volume, starting from the first bar's volume"""
+
+    def __init__(self):
+        self.prev_close = nan
+        self.obv = nan
+
+    def update(self, close: float, volume: float) -> float:
+        if isnan(self.obv):
+            self.obv = volume
+        elif close > self.prev_close:
+            self.obv += volume
+        elif close < self.prev_close:
+            self.obv -= volume
+        self.prev_close = close
+        return self.obv
+
+class VWAPState:
+    """Cumulative volume weighted average price"""
+
+    def __init__(self):
+        self.price_volume = 0.0
+        self.volume = 0.0
+
+    def update(self, close: float, volume: float) -> float:
+        self.price_volume += close * volume
+        self.volume += volume
+        return self.price_volume / self.volume if self.volume > 0 else nan
+
+# Memoized analyze() results, keyed by _result_cache_key; entries expire so history edits are picked up.
+# Only long-lived in-process callers benefit: the CLI runs in a fresh process per request.
+# TTLCache is not thread-safe, so every access goes through _RESULT_CACHE_LOCK.
+_RESULT_CACHE = TTLCache(maxsize=1024, ttl=60)
+_RESULT_CACHE_LOCK = threading.Lock()
+
+_row_timestamp = itemgetter('timestamp')
+
+def _result_cache_key(symbol: str, rows: List[Dict], dtype) -> Tuple:
+    """
+    Cheap fingerprint of raw OHLCV rows: symbol, storage dtype, length and the latest bar
+
+    Computed before any parsing so a cache hit skips building the OHLCVBuffer.
+    On timestamp ties the last such row wins, matching the buffer's stable sort.
+    """
+    last = max(reversed(rows), key=_row_timestamp)
+    return (symbol, np.dtype(dtype).str, len(rows), _row_timestamp(last)) + tuple(last[key] for key in _OHLCV_KEYS)
+
+def _copy_result(result: 'TechnicalAnalysisResult') -> 'TechnicalAnalysisResult':
+    """Copy a result down to its lists and dicts, which is all a caller can mutate"""
+    patterns = result.patterns
+    trend = result.trend
+    return replace(
+        result,
+        indicators=copy.copy(result.indicators),
+        patterns=replace(
+            patterns,
+            patterns_found=list(patterns.patterns_found),
+            bullish_patterns=list(patterns.bullish_patterns),
+            bearish_patterns=list(patterns.bearish_patterns),
+        ),
+        trend=replace(
+            trend,
+            support_levels=list(trend.support_levels),
+            resistance_levels=list(trend.resistance_levels),
+            pivot_points=dict(trend.pivot_points),
+        ),
+        signals=dict(result.signals),
+    )
+
+# Classic floor pivots as linear combinations of the last bar's (high, low, close)
+_PIVOT_KEYS = ('pivot', 'r1', 'r2', 'r3', 's1', 's2', 's3')
+_PIVOT_COEFFICIENTS = np.array([
+    [1, 1, 1],    # pivot = (H + L + C) / 3
+    [2, -1, 2],   # r1 = 2P - L
+    [4, -2, 1],   # r2 = P + (H - L)
+    [5, -4, 2],   # r3 = H + 2(P - L)
+    [-1, 2, 2],   # s1 = 2P - H
+    [-2, 4, 1],   # s2 = P - (H - L)
+    [-4, 5, 2],   # s3 = L - 2(H - P)
+], dtype=np.float64) / 3
+
+# Signal lookup table indexed by the codes computed in _generate_signals
+_SIGNALS = ('hold', 'buy', 'sell')
+_TREND_SIGNAL_CODES = {'bullish': 1, 'bearish': 2}
+
+_warmed_up = False
+
+def _warmup():
+    """Run every kernel once on dummy data so the Numba cache and thread pool are loaded"""
+    global _warmed_up
+    for dtype in (np.float64, np.float32):
+        data = np.ones((len(_OHLCV_KEYS), 4), dtype=dtype)
+        last_bar_engine(*data, np.empty(len(_IND_FIELDS), dtype=np.float64), np.empty(3, dtype=np.int64))
+        batch_last_indicators(data, np.array([0, 2, 4], dtype=np.int64))
+    _warmed_up = True
+
+class TechnicalAnalyzer:
+    """Main technical analysis engine"""
+
+    def __init__(self, dtype=np.float64):
+        self.min_periods = 200  # Minimum data points for reliable analysis
+        # OHLCV storage precision; np.float32 halves memory bandwidth for large batches
+        self.dtype = dtype
+
+        # Long-running services can pay kernel loading and thread pool start-up before the first request
+        if not _warmed_up and os.environ.get('TA_EAGER_WARMUP') == '1':
+            _warmup()
+
+    def analyze(self, ohlcv_data: List[Dict]) -> TechnicalAnalysisResult:
+        """
+        Perform complete technical analysis on OHLCV data
+
+        Args:
+            ohlcv_data: List of OHLCV dictionaries with keys: timestamp, open, high, low, close, volume
+
+        Returns:
+            TechnicalAnalysisResult object
+        """
+        if not ohlcv_data:
+            raise ValueError('No OHLCV data provided')
+        symbol = ohlcv_data[0].get('symbol', 'UNKNOWN')
+
+        # Repeated refreshes of an unchanged series reuse the previous result
+        cache_key = _result_cache_key(symbol, ohlcv_data, self.dtype)
+        with _RESULT_CACHE_LOCK:
+            cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return _copy_result(cached)
+
+        buffer = OHLCVBuffer.from_rows(ohlcv_data, self.dtype)
+
+        # Calculate indicators and recognize patterns in one compiled call
+        indicator_values = np.empty(len(_IND_FIELDS), dtype=np.float64)
+        pattern_masks = np.empty(3, dtype=np.int64)
+        last_bar_engine(buffer.open, buffer.high, buffer.low, buffer.close, buffer.volume,
+                        indicator_values, pattern_masks)
+
+        indicators = self._indicators_from_values(indicator_values)
+        patterns = self._patterns_from_masks(*(int(m) for m in pattern_masks))
+
+        result = self._build_result(symbol, buffer, indicators, patterns)
+        # Callers get their own copy, so mutating a result never leaks into later cache hits
+        cached = _copy_result(result)
+        with _RESULT_CACHE_LOCK:
+            _RESULT_CACHE[cache_key] = cached
+        return result
+
+    def analyze_batch(self, batches: List[List[Dict]]) -> List[TechnicalAnalysisResult]:
+        """
+        Perform technical analysis on several symbols in parallel
+
+        last_bar_engine runs for every symbol inside one multi-threaded
+        Numba kernel.
+
+        Args:
+            batches: One list of OHLCV dictionaries per symbol, as accepted by analyze()
+
+        Returns:
+            TechnicalAnalysisResult objects in input order
+        """
+        buffers = [OHLCVBuffer.from_rows(rows, self.dtype) for rows in batches]
+        if not buffers:
+            return []
+
+        offsets = np.zeros(len(buffers) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(buffer) for buffer in buffers])
+        data = np.concatenate([buffer.data for buffer in buffers], axis=1)
+
+        indicator_values, pattern_masks = batch_last_indicators(data, offsets)
+
+        results = []
+        for rows, buffer, values, masks in zip(batches, buffers, indicator_values, pattern_masks):
+            indicators = self._indicators_from_values(values)
+            patterns = self._patterns_from_masks(*(int(m) for m in masks))
+            results.append(self._build_result(rows[0].get('symbol', 'UNKNOWN'), buffer, indicators, patterns))
+        return results
+
+    def _build_result(self, symbol: str, buffer: OHLCVBuffer, indicators: TechnicalIndicators,
+                      patterns: PatternRecognition) -> TechnicalAnalysisResult:
+        """Derive trend, signals and confidence and assemble the final result"""
+
+        # Analyze trend
+        trend = self._analyze_trend(buffer.close, buffer.high, buffer.low, indicators)
+
+        # Generate trading signals
+        signals = self._generate_signals(indicators, patterns, trend)
+
+        # Calculate confidence score
+        confidence = self._calculate_confidence(indicators, patterns, trend, len(buffer))
+
+        return TechnicalAnalysisResult(
+            symbol=symbol,
+            timestamp=int(buffer.ts[-1]),
+            current_price=float(buffer.close[-1]),
+            indicators=indicators,
+            patterns=patterns,
+            trend=trend,
+            signals=signals,
+            confidence=confidence
+        )
+
+    def _indicators_from_values(self, values: np.ndarray) -> TechnicalIndicators:
+        """Map last_bar_engine indicator output onto TechnicalIndicators"""
+        # tolist() converts all values to Python floats in one call instead of one float() per numpy scalar
+        return TechnicalIndicators(*(None if v != v else v for v in values.tolist()))
+
+    def _recognize_patterns(self, open_prices, high, low, close) -> PatternRecognition:
+        """Recognize candlestick patterns completed by the latest bar (see last_bar_patterns for definitions)"""
+
+        found_mask, bullish_mask, bearish_mask = last_bar_patterns(
+            open_prices[-PATTERN_BARS:], high[-PATTERN_BARS:], low[-PATTERN_BARS:], close[-PATTERN_BARS:]
+        )
+        return self._patterns_from_masks(found_mask, bullish_mask, bearish_mask)
+
+    def _patterns_from_masks(self, found_mask: int, bullish_mask: int, bearish_mask: int) -> PatternRecognition:
+        """Decode last_bar_patterns bitmasks into a PatternRecognition"""
+
+        patterns_found = _decode_patterns(found_mask, _FOUND_PATTERN_NAMES)
+        bullish_patterns = _decode_patterns(bullish_mask)
+        bearish_patterns = _decode_patterns(bearish_mask)
+
+        # Determine pattern strength
+        strength = 'weak'
+        if len(patterns_found) >= 3:
+            strength = 'strong'
+        elif len(patterns_found) >= 2:
+            strength = 'moderate'
+
+        return PatternRecognition(
+            patterns_found=patterns_found,
+            bullish_patterns=bullish_patterns,
+            bearish_patterns=bearish_patterns,
+            strength=strength
+        )
+
+    def _analyze_trend(self, close, high, low, indicators: TechnicalIndicators) -> TrendAnalysis:
+        """Analyze price trend and identify support/resistance levels"""
+
+        # Determine trend direction
+        trend_direction = 'neutral'
+        trend_strength = 50.0
+
+        if indicators.sma_50 and indicators.sma_200:
+            if close[-1] > indicators.sma_50 > indicators.sma_200:
+                trend_direction = 'bullish'
+                trend_strength = 75.0
+            elif close[-1] < indicators.sma_50 < indicators.sma_200:
+                trend_direction = 'bearish'
+                trend_strength = 75.0
+        elif indicators.ema_12 and indicators.ema_26:
+            if indicators.ema_12 > indicators.ema_26:
+                trend_direction = 'bullish'
+                trend_strength = 60.0
+            elif indicators.ema_12 < indicators.ema_26:
+                trend_direction = 'bearish'
+                trend_strength = 60.0
+
+        # Identify support and resistance levels from recent local extrema,
+        # falling back to pivot points on a side with no extremum beyond the price
+        support_levels = []
+        resistance_levels = []
+        pivot_points = {}
+
+        if len(close) > 0:
+            # Calculate pivot points in one matrix-vector product
+            levels = (_PIVOT_COEFFICIENTS @ np.array([high[-1], low[-1], close[-1]], dtype=np.float64)).tolist()
+            pivot_points = dict(zip(_PIVOT_KEYS, levels))
+
+            highs = high[-SR_LOOKBACK:]
+            lows = low[-SR_LOOKBACK:]
+            peaks, troughs = rolling_extrema(highs, lows, SR_ORDER)
+            price = close[-1]
+
+            # Up to three distinct levels on each side, nearest to the price first
+            resistance = np.unique(highs[peaks])
+            resistance = resistance[resistance > price][:3]
+            support = np.unique(lows[troughs])
+            support = support[support < price][::-1][:3]
+
+            resistance_levels = resistance.tolist() if resistance.size else levels[1:4]
+            support_levels = support.tolist() if support.size else levels[4:7]
+
+        return TrendAnalysis(
+            trend_direction=trend_direction,
+            trend_strength=trend_strength,
+            support_levels=support_levels,
+            resistance_levels=resistance_levels,
+            pivot_points=pivot_points
+        )
+
+    def _generate_signals(self, indicators: TechnicalIndicators, patterns: PatternRecognition, trend: TrendAnalysis) -> Dict[str, str]:
+        """Generate trading signals based on indicators, patterns, and trend
+
+        Each rule computes a code into _SIGNALS (0 hold, 1 buy, 2 sell) from
+        boolean arithmetic instead of if/elif chains.
+        """
+
+        codes = {}
+
+        # RSI Signal
+        if indicators.rsi_14:
+            codes['rsi'] = (indicators.rsi_14 < 30) + 2 * (indicators.rsi_14 > 70)
+
+        # MACD Signal
+        if indicators.macd and indicators.macd_signal:
+            codes['macd'] = (indicators.macd > indicators.macd_signal) + 2 * (indicators.macd < indicators.macd_signal)
+
+        # Bollinger Bands Signal (touching the lower band wins if the bands collapse)
+        if indicators.bb_upper and indicators.bb_lower:
+            current_price = indicators.vwap or 0
+            codes['bollinger'] = (current_price <= indicators.bb_lower) + 2 * (
+                (current_price >= indicators.bb_upper) & (current_price > indicators.bb_lower)
+            )
+
+        # Pattern Signal
+        bullish_count = len(patterns.bullish_patterns)
+        bearish_count = len(patterns.bearish_patterns)
+        codes['pattern'] = (bullish_count > bearish_count) + 2 * (bearish_count > bullish_count)
+
+        # Trend Signal
+        codes['trend'] = _TREND_SIGNAL_CODES.get(trend.trend_direction, 0)
+
+        # Overall Signal (majority vote)
+        votes = list(codes.values())
+        buy_count = votes.count(1)
+        sell_count = votes.count(2)
+        codes['overall'] = (buy_count > sell_count) + 2 * (sell_count > buy_count)
+
+        return {name: _SIGNALS[code] for name, code in codes.items()}
+
+    def _calculate_confidence(self, indicators: TechnicalIndicators, patterns: PatternRecognition, trend: TrendAnalysis, data_points: int) -> float:
+        """Calculate confidence score for the analysis"""
+
+        confidence = 0.0
+
+        # Data quality (max 30 points)
+        if data_points >= self.min_periods:
+            confidence += 30.0
+        else:
+            confidence += (data_points / self.min_periods) * 30.0
+
+        # Indicator agreement (max 30 points)
+        indicator_count = sum(1 for name in _IND_FIELDS if getattr(indicators, name) is not None)
+        confidence += (indicator_count / len(_IND_FIELDS)) * 30.0
+
+        # Pattern strength (max 20 points)
+        if patterns.strength == 'strong':
+            confidence += 20.0
+        elif patterns.strength == 'moderate':
+            confidence += 12.0
+        elif patterns.strength == 'weak':
+            confidence += 5.0
+
+        # Trend strength (max 20 points)
+        confidence += (trend.trend_strength / 100) * 20.0
+
+        return min(confidence, 100.0)
+
+class StreamingTechnicalAnalyzer(TechnicalAnalyzer):
+    """
+    Incremental technical analysis for live tick ingestion
+
+    Keeps running indicator state per symbol so each new bar costs O(1)
+    instead of re-running every indicator over the full history. Only the
+    last max(PATTERN_BARS, SR_LOOKBACK) bars are retained for candlestick
+    patterns and support/resistance detection.
+    """
+
+    def __init__(self, symbol: str = 'UNKNOWN'):
+        super().__init__()
+        self.symbol = symbol
+        self.bars = 0
+        self.last_timestamp: Optional[int] = None
+        self.recent = deque(maxlen=max(PATTERN_BARS, SR_LOOKBACK))
+
+        self.sma_20 = SMAState(20)
+        self.sma_50 = SMAState(50)
+        self.sma_200 = SMAState(200)
+        self.ema_12 = EMAState(12)
+        self.ema_26 = EMAState(26)
+        self.rsi_14 = RSIState(14)
+        self.macd = MACDState(12, 26, 9)
+        self.stoch = StochState(14, 3, 3)
+        self.bbands = BBState(20, 2.0)
+        self.atr_14 = ATRState(14)
+        self.obv = OBVState()
+        self.vwap = VWAPState()
+
+    def analyze_tick(self, ohlcv: Dict) -> TechnicalAnalysisResult:
+        """
+        Update indicator state with a new bar and analyze it
+
+        Args:
+            ohlcv: OHLCV dictionary with keys: timestamp, open, high, low, close, volume
+
+        Returns:
+            TechnicalAnalysisResult object for the latest bar
+        """
+        timestamp = int(ohlcv['timestamp'])
+        if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            raise ValueError(f'Bar timestamp {timestamp} is not after the last processed bar {self.last_timestamp}')
+
+        open_price = float(ohlcv['open'])
+        high = float(ohlcv['high'])
+        low = float(ohlcv['low'])
+        close = float(ohlcv['close'])
+        volume = float(ohlcv['volume'])
+
+        self.bars += 1
+        self.last_timestamp = timestamp
+        self.recent.append((open_price, high, low, close))
+
+        macd, macd_signal, macd_hist = self.macd.update(close)
+        stoch_k, stoch_d = self.stoch.update(high, low, close)
+        bb_upper, bb_middle, bb_lower = self.bbands.update(close)
+
+        indicators = TechnicalIndicators(
+            sma_20=_optional_float(self.sma_20.update(close)),
+            sma_50=_optional_float(self.sma_50.update(close)),
+            sma_200=_optional_float(self.sma_200.update(close)),
+            ema_12=_optional_float(self.ema_12.update(close)),
+            ema_26=_optional_float(self.ema_26.update(close)),
+            rsi_14=_optional_float(self.rsi_14.update(close)),
+            macd=_optional_float(macd),
+            macd_signal=_optional_float(macd_signal),
+            macd_histogram=_optional_float(macd_hist),
+            stoch_k=_optional_float(stoch_k),
+            stoch_d=_optional_float(stoch_d),
+            bb_upper=_optional_float(bb_upper),
+            bb_middle=_optional_float(bb_middle),
+            bb_lower=_optional_float(bb_lower),
+            atr_14=_optional_float(self.atr_14.update(high, low, close)),
+            obv=_optional_float(self.obv.update(close, volume)),
+            vwap=_optional_float(self.vwap.update(close, volume)),
+        )
+
+        # (4, N) rows so each series is a contiguous view for the kernels
+        recent = np.ascontiguousarray(np.array(self.recent, dtype=np.float64).T)
+        open_prices, highs, lows, closes = recent
+
+        patterns = self._recognize_patterns(open_prices, highs, lows, closes)
+        trend = self._analyze_trend(closes, highs, lows, indicators)
+        signals = self._generate_signals(indicators, patterns, trend)
+        confidence = self._calculate_confidence(indicators, patterns, trend, self.bars)
+
+        return TechnicalAnalysisResult(
+            symbol=ohlcv.get('symbol', self.symbol),
+            timestamp=timestamp,
+            current_price=close,
+            indicators=indicators,
+            patterns=patterns,
+            trend=trend,
+            signals=signals,
+            confidence=confidence
+        )
@@ -0,0 +1,40 @@
+import json
+import os
+import sys
+
+import numpy as np
+
+# The engine is imported as a top-level module, the same way the CLI runs it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def make_rows(n: int, seed: int = 7, symbol: str = 'TEST') -> list:
+    """Deterministic random-walk OHLCV rows, one hour apart"""
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, n))
+    open_ = close + rng.normal(0.0, 0.5, n)
+    high = np.maximum(open_, close) + rng.uniform(0.0, 1.0, n)
+    low = np.minimum(open_, close) - rng.uniform(0.0, 1.0, n)
+    volume = rng.uniform(1_000.0, 5_000.0, n)
+    return [
+        {
+            'symbol': symbol,
+            'timestamp': 1_700_000_000_000 + i * 3_600_000,
+            'open': float(open_[i]),
+            'high': float(high[i]),
+            'low': float(low[i]),
+            'close': float(close[i]),
+            'volume': float(volume[i]),
+        }
+        for i in range(n)
+    ]
+
+
+
+
+def load_talib_golden() -> dict:
+    """TA-Lib reference values written by fixtures/generate_talib_golden.py"""
+    with open(os.path.join(FIXTURES, 'talib_golden.json')) as f:
+        return json.load(f)
@@ -0,0 +1,72 @@
+"""
+Regenerate talib_golden.json: TA-Lib reference values for the last bar of
+growing prefixes of one OHLCV series. Needs TA-Lib (ta-lib<0.7), which the
+engine itself no longer does; run once and commit the output.
+
+    python tests/fixtures/generate_talib_golden.py
+"""
+import json
+import os
+import sys
+
+import numpy as np
+import talib
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+from conftest import make_rows  # noqa: E402
+
+# Each indicator's warm-up edge and its neighbours, plus a few long series
+LENGTHS = (1, 2, 13, 14, 15, 16, 17, 18, 19, 20, 21, 25, 26, 27,
+           33, 34, 35, 49, 50, 51, 199, 200, 201, 300)
+
+
+def last(values):
+    value = float(values[-1])
+    return None if np.isnan(value) else value
+
+
+def reference(rows):
+    high = np.array([r['high'] for r in rows])
+    low = np.array([r['low'] for r in rows])
+    close = np.array([r['close'] for r in rows])
+    volume = np.array([r['volume'] for r in rows])
+    macd, macd_signal, macd_hist = talib.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)
+    stoch_k, stoch_d = talib.STOCH(high, low, close, fastk_period=14, slowk_period=3, slowd_period=3)
+    bb_upper, bb_middle, bb_lower = talib.BBANDS(close, timeperiod=20, nbdevup=2, nbdevdn=2)
+    return {
+        'sma_20': last(talib.SMA(close, timeperiod=20)),
+        'sma_50': last(talib.SMA(close, timeperiod=50)),
+        'sma_200': last(talib.SMA(close, timeperiod=200)),
+        'ema_12': last(talib.EMA(close, timeperiod=12)),
+        'ema_26': last(talib.EMA(close, timeperiod=26)),
+        'rsi_14': last(talib.RSI(close, timeperiod=14)),
+        'macd': last(macd),
+        'macd_signal': last(macd_signal),
+        'macd_histogram': last(macd_hist),
+        'stoch_k': last(stoch_k),
+        'stoch_d': last(stoch_d),
+        'bb_upper': last(bb_upper),
+        'bb_middle': last(bb_middle),
+        'bb_lower': last(bb_lower),
+        'atr_14': last(talib.ATR(high, low, close, timeperiod=14)),
+        'obv': last(talib.OBV(close, volume)),
+        'vwap': last((close * volume).cumsum() / volume.cumsum()),
+    }
+
+
+def main():
+    rows = make_rows(max(LENGTHS))
+    golden = {
+        'talib_version': talib.__version__,
+        'lengths': list(LENGTHS),
+        'rows': rows,
+        'expected': {str(n): reference(rows[:n]) for n in LENGTHS},
+    }
+    with open(os.path.join(HERE, 'talib_golden.json'), 'w') as f:
+        json.dump(golden, f, indent=1)
+        f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import technical_analysis
+import technical_analysis_core
+from conftest import make_rows
+
+CLI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'technical_analysis.py')
+
+
+def test_engine_names_are_reexported():
+    assert technical_analysis.TechnicalAnalyzer is technical_analysis_core.TechnicalAnalyzer
+    assert technical_analysis.StreamingTechnicalAnalyzer is technical_analysis_core.StreamingTechnicalAnalyzer
+    with pytest.raises(AttributeError):
+        technical_analysis.no_such_name
+
+
+def test_import_does_not_load_engine():
+    code = 'import sys, technical_analysis; print("numpy" in sys.modules or "technical_analysis_core" in sys.modules)'
+    out = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(CLI),
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == 'False'
+
+
+def test_cli_round_trip():
+    rows = make_rows(60)
+    out = subprocess.run([sys.executable, CLI, json.dumps(rows)], capture_output=True, text=True, check=True)
+    result = json.loads(out.stdout)
+    assert result['symbol'] == 'TEST'
+    assert result['timestamp'] == rows[-1]['timestamp']
+    assert result['indicators']['sma_20'] == pytest.approx(
+        technical_analysis_core.TechnicalAnalyzer().analyze(rows).indicators.sma_20)
+
+
+def test_cli_usage_error():
+    out = subprocess.run([sys.executable, CLI], capture_output=True, text=True)
+    assert out.returncode == 1
+    assert json.loads(out.stdout)['error'] == 'No OHLCV data provided'
@@ -0,0 +1,44 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+
+from cachetools import TTLCache
+
+import technical_analysis_core as core
+from conftest import make_rows
+
+
+def test_cached_result_is_a_private_copy():
+    analyzer = core.TechnicalAnalyzer()
+    rows = make_rows(60)
+    first = analyzer.analyze(rows)
+    expected = asdict(first)
+    first.signals.clear()
+    first.trend.support_levels.append(-1.0)
+    first.indicators.rsi_14 = None
+    assert asdict(analyzer.analyze(rows)) == expected
+
+
+def test_concurrent_access(monkeypatch):
+    analyzer = core.TechnicalAnalyzer()
+    rows = make_rows(60)
+    prefixes = [rows[:n] for n in range(20, 60, 2)]
+    expected = [asdict(analyzer.analyze(prefix)) for prefix in prefixes]
+
+    # A tiny, fast-expiring cache and frequent thread switches make threads expire
+    # and evict each other's entries mid-lookup; unlocked this raises KeyError
+    monkeypatch.setattr(core, '_RESULT_CACHE', TTLCache(maxsize=4, ttl=0.001))
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def worker(offset):
+        for i in range(1000):
+            k = (i + offset) % len(prefixes)
+            assert asdict(analyzer.analyze(prefixes[k])) == expected[k]
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for future in [pool.submit(worker, t) for t in range(8)]:
+                future.result()
+    finally:
+        sys.setswitchinterval(interval)
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+import technical_analysis_core as core
+
+
+def brute_force_extrema(high, low, k):
+    centers = range(k, len(high) - k)
+    maxima = [i for i in centers if high[i] == high[i - k:i + k + 1].max()]
+    minima = [i for i in centers if low[i] == low[i - k:i + k + 1].min()]
+    return maxima, minima
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+@pytest.mark.parametrize('k', [1, 2, core.SR_ORDER])
+def test_rolling_extrema_matches_brute_force(dtype, k):
+    rng = np.random.default_rng(3)
+    for n in (0, 1, 2 * k, 2 * k + 1, 30, 250):
+        # Few distinct levels, so plateaus and tied extrema are common
+        high = rng.integers(0, 6, n).astype(dtype)
+        low = rng.integers(0, 6, n).astype(dtype)
+        maxima, minima = core.rolling_extrema(high, low, k)
+        expected_maxima, expected_minima = brute_force_extrema(high, low, k)
+        assert maxima.tolist() == expected_maxima, n
+        assert minima.tolist() == expected_minima, n
@@ -0,0 +1,43 @@
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+
+import technical_analysis_core as core
+from conftest import load_talib_golden
+
+# Golden values are committed so the suite runs without TA-Lib installed
+GOLDEN = load_talib_golden()
+LENGTHS = GOLDEN['lengths']
+ROWS = GOLDEN['rows']
+
+
+def assert_matches(indicators, expected, rel):
+    actual = asdict(indicators)
+    assert actual.keys() == expected.keys()
+    for name, value in expected.items():
+        if value is None:
+            assert actual[name] is None, name
+        else:
+            assert actual[name] == pytest.approx(value, rel=rel, abs=rel), name
+
+
+@pytest.mark.parametrize('n', LENGTHS)
+def test_analyze_matches_talib(n):
+    rows = ROWS[:n]
+    result = core.TechnicalAnalyzer().analyze(rows)
+    assert_matches(result.indicators, GOLDEN['expected'][str(n)], rel=1e-9)
+
+
+@pytest.mark.parametrize('n', LENGTHS)
+def test_analyze_float32_matches_talib(n):
+    rows = ROWS[:n]
+    result = core.TechnicalAnalyzer(dtype=np.float32).analyze(rows)
+    assert_matches(result.indicators, GOLDEN['expected'][str(n)], rel=1e-3)
+
+
+def test_analyze_batch_matches_talib():
+    rows = ROWS
+    results = core.TechnicalAnalyzer().analyze_batch([rows[:n] for n in LENGTHS])
+    for n, result in zip(LENGTHS, results):
+        assert_matches(result.indicators, GOLDEN['expected'][str(n)], rel=1e-9)
@@ -2,7 +2,7 @@
  * Charts Agent - Container-Based Technical Analysis
  *
  * Provides advanced chart analysis and technical indicators using Python ML stack.
- * Runs in Cloudflare Container with TA-Lib, pandas, numpy, scikit-learn.
+ * Runs in Cloudflare Container with numpy, Numba, scikit-learn.
  *
  * Features:
  * - Technical indicators (RSI, MACD, Bollinger Bands, etc.)